@@ -5,6 +5,7 @@ Environment variables and global settings.
 
 import os
 import logging
+import secrets
 from pathlib import Path
 
 # Configure logging
@@ -18,25 +19,53 @@ logging.getLogger("httpx").setLevel(logging.WARNING)
 
 # Configuration from environment variables
 TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")
-ALLOWED_CHAT_IDS = os.getenv("ALLOWED_CHAT_IDS", "").split(",")
+# Chat IDs are parsed to integers once and kept in a frozenset for O(1) membership checks
+ALLOWED_CHAT_IDS = frozenset(
+    int(chat_id.strip()) for chat_id in os.getenv("ALLOWED_CHAT_IDS", "").split(",") if chat_id.strip()
+)
 WATCH_FOLDER = os.getenv("WATCH_FOLDER", "/watch")
 RSS_STORAGE_FILE = os.getenv("RSS_STORAGE_FILE", "rss_urls.json")
+COMMANDS_CACHE_FILE = os.getenv(
+    "COMMANDS_CACHE_FILE", os.path.expanduser("~/.cache/send-torrent-telegram-bot/commands.sha256")
+)
 
 # Batch processing configuration
 BATCH_TIMEOUT = 2.0  # seconds to wait for more files
+MAX_BATCH = 50  # files per summary; a full batch is sent right away
+MAX_CONCURRENT_DOWNLOADS = 4  # torrent downloads/writes in progress at once, across all chats
+DOWNLOAD_TIMEOUT = 60  # seconds before a stalled RSS torrent download is abandoned
+
+# HTTP client configuration
+CONNECTION_POOL_SIZE = 256  # concurrent connections for Bot API requests
+HTTP_VERSION = "2"  # multiplex concurrent requests over one connection
+POLL_TIMEOUT = 30  # seconds Telegram holds each getUpdates long poll open
+
+# Update delivery: "polling" (default) or "webhook", where Telegram pushes updates to WEBHOOK_URL
+BOT_MODE = os.getenv("BOT_MODE", "polling").strip().lower()
+WEBHOOK_URL = os.getenv("WEBHOOK_URL", "").rstrip("/")
+WEBHOOK_LISTEN = os.getenv("WEBHOOK_LISTEN", "0.0.0.0")
+WEBHOOK_PORT = int(os.getenv("PORT", "8080"))
+WEBHOOK_PATH = os.getenv("WEBHOOK_PATH", "webhook").strip("/")
+# Telegram sends this in a header with every update and the bot rejects requests without it.
+# A random one is generated if unset; the webhook is registered again on every start anyway.
+WEBHOOK_SECRET = os.getenv("WEBHOOK_SECRET") or secrets.token_urlsafe(32)
 
 # Validate configuration
 if not TELEGRAM_BOT_TOKEN:
     raise ValueError("TELEGRAM_BOT_TOKEN environment variable is required")
 
-if not ALLOWED_CHAT_IDS or ALLOWED_CHAT_IDS == [""]:
+if not ALLOWED_CHAT_IDS:
     raise ValueError("ALLOWED_CHAT_IDS environment variable is required")
 
-# Convert chat IDs to integers and filter empty strings
-ALLOWED_CHAT_IDS = [int(chat_id.strip()) for chat_id in ALLOWED_CHAT_IDS if chat_id.strip()]
+if BOT_MODE not in ("polling", "webhook"):
+    raise ValueError("BOT_MODE must be 'polling' or 'webhook'")
+
+if BOT_MODE == "webhook" and not WEBHOOK_URL:
+    raise ValueError("WEBHOOK_URL environment variable is required when BOT_MODE is 'webhook'")
 
 # Ensure watch folder exists
-Path(WATCH_FOLDER).mkdir(parents=True, exist_ok=True)
+WATCH_FOLDER_PATH = Path(WATCH_FOLDER).resolve()
+WATCH_FOLDER_PATH.mkdir(parents=True, exist_ok=True)
 
 logger.info(f"Bot configured with {len(ALLOWED_CHAT_IDS)} allowed chat ID(s)")
 logger.info(f"Watch folder: {WATCH_FOLDER}")
@@ -3,39 +3,36 @@ Command Handlers
 Basic bot commands (start, help, status, menu).
 """
 
-import os
-from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
+import asyncio
+from telegram import Update
 from telegram.ext import ContextTypes
 
-from bot.config import logger, ALLOWED_CHAT_IDS, WATCH_FOLDER
-from bot.utils import escape_markdown_v2, is_authorized, get_main_menu_keyboard, get_back_keyboard
+from bot.config import logger
+from bot.utils import (
+    escape_markdown_v2,
+    display_name,
+    is_authorized,
+    get_main_menu_keyboard,
+    BACK_KEYBOARD,
+    count_torrents,
+    build_status_message,
+    build_chatid_message,
+    build_welcome_message,
+    MENU_MESSAGE,
+    HELP_MESSAGE,
+    AUTHOR_MESSAGE,
+)
 from bot.services import has_rss
 
 
 async def start_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /start command."""
     chat_id = update.effective_chat.id
-    user_name = update.effective_user.first_name or "User"
+    user_name = display_name(update.effective_user.first_name)
 
     logger.info(f"Start command received from chat ID: {chat_id}")
 
-    is_auth = is_authorized(chat_id)
-    auth_emoji = "✅" if is_auth else "⚠️"
-
-    welcome_message = (
-        f"━━━━━━━━━━━━━━━━━━━━━━\n"
-        f"🤖 *SEND TORRENT BOT*\n"
-        f"━━━━━━━━━━━━━━━━━━━━━━\n\n"
-        f"👋 Welcome *{user_name}*\\!\n\n"
-        f"I help you manage torrents remotely\\.\n"
-        f"Just send me a `.torrent` file and I'll\n"
-        f"handle the rest\\! 🚀\n\n"
-        f"┏━━━━━━━━━━━━━━━━━━━━┓\n"
-        f"  {auth_emoji} *Authorization Status*\n"
-        f"     {'`AUTHORIZED`' if is_auth else '`NOT AUTHORIZED`'}\n"
-        f"┗━━━━━━━━━━━━━━━━━━━━┛\n\n"
-        f"💡 Use the menu below to get started\\!"
-    )
+    welcome_message = build_welcome_message(user_name, is_authorized(chat_id))
 
     await update.message.reply_text(
         welcome_message, parse_mode="MarkdownV2", reply_markup=get_main_menu_keyboard(has_rss=has_rss(chat_id))
@@ -44,29 +41,8 @@ async def start_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
 
 async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /help command."""
-    help_message = (
-        "━━━━━━━━━━━━━━━━━━━━━━\n"
-        "📖 *HELP GUIDE*\n"
-        "━━━━━━━━━━━━━━━━━━━━━━\n\n"
-        "*Available Commands:*\n\n"
-        "🏠 `/start` \\- Main menu \\& welcome\n"
-        "❓ `/help` \\- Show this help guide\n"
-        "📊 `/status` \\- Check bot status\n"
-        "🔍 `/menu` \\- Show interactive menu\n"
-        "📡 `/setrss <URL> <name>` \\- Add RSS\n"
-        "🔎 `/browse` \\- Browse your RSS feeds\n"
-        "🗑️ `/clearrss` \\- Manage RSS feeds\n\n"
-        "━━━━━━━━━━━━━━━━━━━━\n\n"
-        "*Quick Actions:*\n\n"
-        "• Send any `.torrent` file\n"
-        "• Use the menu buttons\n"
-        "• Check your authorization\n"
-        "• Browse your RSS feeds\n\n"
-        "💡 *Tip:* Up to 10 RSS feeds\\!"
-    )
-
     await update.message.reply_text(
-        help_message, parse_mode="MarkdownV2", reply_markup=get_back_keyboard()
+        HELP_MESSAGE, parse_mode="MarkdownV2", reply_markup=BACK_KEYBOARD
     )
 
 
@@ -75,96 +51,39 @@ async def status_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     chat_id = update.effective_chat.id
     is_auth = is_authorized(chat_id)
 
-    auth_icon = "✅" if is_auth else "❌"
-    auth_text = "AUTHORIZED" if is_auth else "NOT AUTHORIZED"
-
     # Count torrent files in watch folder
-    try:
-        torrent_count = len([f for f in os.listdir(WATCH_FOLDER) if f.endswith(".torrent")])
-    except:
-        torrent_count = 0
-
-    status_message = (
-        f"━━━━━━━━━━━━━━━━━━━━━━\n"
-        f"📊 *BOT STATUS*\n"
-        f"━━━━━━━━━━━━━━━━━━━━━━\n\n"
-        f"🟢 *System:* `ONLINE`\n\n"
-        f"┏━━━━━━━━━━━━━━━━━━━━┓\n"
-        f"  🔑 *Your Access*\n"
-        f"     {auth_icon} `{auth_text}`\n"
-        f"┗━━━━━━━━━━━━━━━━━━━━┛\n\n"
-        f"📁 *Watch Folder:*\n"
-        f"   `{WATCH_FOLDER}`\n\n"
-        f"📊 *Statistics:*\n"
-        f"   • Authorized Users: `{len(ALLOWED_CHAT_IDS)}`\n"
-        f"   • Torrents in Queue: `{torrent_count}`\n\n"
-        f"━━━━━━━━━━━━━━━━━━━━\n"
-        f"🕐 Last checked: `Now`"
-    )
+    torrent_count = await asyncio.to_thread(count_torrents)
+
+    status_message = build_status_message(is_auth, torrent_count)
 
     await update.message.reply_text(
-        status_message, parse_mode="MarkdownV2", reply_markup=get_back_keyboard()
+        status_message, parse_mode="MarkdownV2", reply_markup=BACK_KEYBOARD
     )
 
 
 async def menu_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /menu command."""
     chat_id = update.effective_chat.id
-    menu_message = (
-        "━━━━━━━━━━━━━━━━━━━━━━\n"
-        "🎯 *MAIN MENU*\n"
-        "━━━━━━━━━━━━━━━━━━━━━━\n\n"
-        "Select an option below:"
-    )
 
     await update.message.reply_text(
-        menu_message, parse_mode="MarkdownV2", reply_markup=get_main_menu_keyboard(has_rss=has_rss(chat_id))
+        MENU_MESSAGE, parse_mode="MarkdownV2", reply_markup=get_main_menu_keyboard(has_rss=has_rss(chat_id))
     )
 
 
 async def chatid_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /chatid command."""
     chat_id = update.effective_chat.id
-    user_name = update.effective_user.first_name or "User"
-
-    chat_id_message = (
-        f"━━━━━━━━━━━━━━━━━━━━━━\n"
-        f"🔑 *YOUR CHAT ID*\n"
-        f"━━━━━━━━━━━━━━━━━━━━━━\n\n"
-        f"👤 *User:* {user_name}\n"
-        f"🆔 *Chat ID:* `{chat_id}`\n\n"
-        f"━━━━━━━━━━━━━━━━━━━━\n\n"
-        f"💡 *Usage:*\n\n"
-        f"Add this ID to the\n"
-        f"`ALLOWED_CHAT_IDS` variable\n"
-        f"in your `.env` file\\.\n\n"
-        f"Example:\n"
-        f"`ALLOWED_CHAT_IDS={chat_id}`\n\n"
-        f"⚠️ Keep this ID private\\!"
-    )
+    user_name = display_name(update.effective_user.first_name)
+
+    chat_id_message = build_chatid_message(chat_id, user_name)
 
     await update.message.reply_text(
-        chat_id_message, parse_mode="MarkdownV2", reply_markup=get_back_keyboard()
+        chat_id_message, parse_mode="MarkdownV2", reply_markup=BACK_KEYBOARD
     )
 
 
 async def author_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /author command."""
-    author_message = (
-        "━━━━━━━━━━━━━━━━━━━━━━\n"
-        "👨‍💻 *AUTHOR*\n"
-        "━━━━━━━━━━━━━━━━━━━━━━\n\n"
-        "*Arturo Carretero Calvo*\n\n"
-        "━━━━━━━━━━━━━━━━━━━━\n\n"
-        "💻 *GitHub:*\n"
-        "[github\\.com/ArtCC](https://github.com/ArtCC)\n\n"
-        "🚀 Check out my other projects\\!\n\n"
-        "━━━━━━━━━━━━━━━━━━━━\n\n"
-        "✨ *Built with:*\n"
-        "GitHub Copilot \(Claude Sonnet 4\\.5\)\n\n"
-        "📄 *License:* Apache 2\\.0"
-    )
-
     await update.message.reply_text(
-        author_message, parse_mode="MarkdownV2", reply_markup=get_back_keyboard()
+        AUTHOR_MESSAGE, parse_mode="MarkdownV2", reply_markup=BACK_KEYBOARD
     )
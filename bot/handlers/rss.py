@@ -3,29 +3,66 @@ RSS Handlers
 Command and callback handlers for RSS feed functionality.
 """
 
-import os
 import math
-import urllib.request
-import tempfile
-import feedparser
+import asyncio
+from functools import lru_cache
+from urllib.parse import urlsplit
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import ContextTypes
 from telegram.error import BadRequest
 
-from bot.config import logger, WATCH_FOLDER
-from bot.utils import escape_markdown_v2, is_authorized, get_main_menu_keyboard, get_back_keyboard
-from bot.services import save_rss_url, delete_rss_url, get_rss_url, get_all_rss, has_rss, MAX_RSS_FEEDS
+from bot.config import logger, WATCH_FOLDER_PATH
+from bot.models import download_slots
+from bot.utils import (
+    escape_markdown_v2,
+    display_name,
+    is_authorized,
+    get_main_menu_keyboard,
+    BACK_KEYBOARD,
+    download_file_atomic,
+    MENU_MESSAGE,
+    UNAUTHORIZED_MESSAGE,
+    NO_RSS_MESSAGE,
+    RSS_DOWNLOAD_SUCCESS_TEMPLATE,
+)
+from bot.services import (
+    save_rss_url,
+    delete_rss_url,
+    get_rss_url,
+    get_all_rss,
+    has_rss,
+    get_cached_feed,
+    MAX_RSS_FEEDS,
+)
+
+# Path separators that can't appear in a saved torrent's file name
+_FILE_NAME_SEPARATORS = str.maketrans({'/': '_', '\\': '_'})
+
+# Static keyboard rows appended to the per-user RSS keyboards
+_BACK_ROW = (InlineKeyboardButton("🔙 Back", callback_data="menu"),)
+_CANCEL_ROW = (InlineKeyboardButton("❌ Cancel", callback_data="rss_cancel"),)
 
 
 # ==================== RSS Commands ====================
 
+@lru_cache(maxsize=256)
+def _is_valid_rss_url(rss_url: str) -> bool:
+    """Check that a URL is HTTP(S) and has a host, so junk like "http:///" is rejected before saving."""
+    if not rss_url.startswith(('http://', 'https://')):
+        return False
+    try:
+        return bool(urlsplit(rss_url).hostname)
+    except ValueError:
+        return False
+
+
 async def setrss_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /setrss command to set RSS feed URL."""
     chat_id = update.effective_chat.id
     
     if not is_authorized(chat_id):
         await update.message.reply_text(
-            "⛔ You are not authorized to use this bot\\.",
+            UNAUTHORIZED_MESSAGE,
             parse_mode="MarkdownV2"
         )
         return
@@ -44,7 +81,7 @@ async def setrss_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
             "💡 Name cannot contain spaces\\.\n"
             f"📊 Maximum {MAX_RSS_FEEDS} RSS feeds allowed\\.",
             parse_mode="MarkdownV2",
-            reply_markup=get_back_keyboard()
+            reply_markup=BACK_KEYBOARD
         )
         return
     
@@ -52,7 +89,7 @@ async def setrss_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     rss_name = context.args[1]
     
     # Basic URL validation
-    if not rss_url.startswith(('http://', 'https://')):
+    if not _is_valid_rss_url(rss_url):
         await update.message.reply_text(
             "❌ Invalid URL\\! Please provide\n"
             "a valid HTTP or HTTPS URL\\.",
@@ -79,7 +116,7 @@ async def setrss_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
             "💡 Use `/browse` to view your feeds\\!\n"
             "🗑️ Use `/clearrss` to manage them\\.",
             parse_mode="MarkdownV2",
-            reply_markup=get_back_keyboard()
+            reply_markup=BACK_KEYBOARD
         )
     else:
         escaped_message = escape_markdown_v2(message)
@@ -96,7 +133,7 @@ async def browse_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     
     if not is_authorized(chat_id):
         await update.message.reply_text(
-            "⛔ You are not authorized to use this bot\\.",
+            UNAUTHORIZED_MESSAGE,
             parse_mode="MarkdownV2"
         )
         return
@@ -105,16 +142,9 @@ async def browse_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     
     if not feeds:
         await update.message.reply_text(
-            "━━━━━━━━━━━━━━━━━━━━━━\n"
-            "📡 *NO RSS FEEDS*\n"
-            "━━━━━━━━━━━━━━━━━━━━━━\n\n"
-            "⚠️ You haven't configured any\n"
-            "RSS feeds yet\\!\n\n"
-            "━━━━━━━━━━━━━━━━━━━━\n\n"
-            "💡 Use `/setrss <URL> <name>`\n"
-            "to add your first RSS feed\\.",
+            NO_RSS_MESSAGE,
             parse_mode="MarkdownV2",
-            reply_markup=get_back_keyboard()
+            reply_markup=BACK_KEYBOARD
         )
         return
     
@@ -125,7 +155,7 @@ async def browse_command(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
             InlineKeyboardButton(f"📡 {name}", callback_data=f"rss_select_{name}")
         ])
     
-    keyboard.append([InlineKeyboardButton("🔙 Back", callback_data="menu")])
+    keyboard.append(_BACK_ROW)
     
     await update.message.reply_text(
         "━━━━━━━━━━━━━━━━━━━━━━\n"
@@ -144,7 +174,7 @@ async def clearrss_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -
     
     if not is_authorized(chat_id):
         await update.message.reply_text(
-            "⛔ You are not authorized to use this bot\\.",
+            UNAUTHORIZED_MESSAGE,
             parse_mode="MarkdownV2"
         )
         return
@@ -156,7 +186,7 @@ async def clearrss_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -
             "⚠️ No RSS feeds configured\\!\n\n"
             "Use `/setrss <URL> <name>` to add one\\.",
             parse_mode="MarkdownV2",
-            reply_markup=get_back_keyboard()
+            reply_markup=BACK_KEYBOARD
         )
         return
     
@@ -167,7 +197,7 @@ async def clearrss_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -
             InlineKeyboardButton(f"🗑️ {name}", callback_data=f"rss_delete_{name}")
         ])
     
-    keyboard.append([InlineKeyboardButton("🔙 Back", callback_data="menu")])
+    keyboard.append(_BACK_ROW)
     
     await update.message.reply_text(
         "━━━━━━━━━━━━━━━━━━━━━━\n"
@@ -197,45 +227,8 @@ async def handle_rss_select(update: Update, context: ContextTypes.DEFAULT_TYPE)
         await query.answer("❌ Feed not found!", show_alert=True)
         return
     
-    # Store current feed name in context
-    context.user_data['rss_current_feed'] = feed_name
-    context.user_data['rss_current_page'] = 0
-    context.user_data['rss_selected'] = set()
-    
-    # Show loading
-    await query.edit_message_text(
-        f"📡 Loading *{escape_markdown_v2(feed_name)}*\\.\\.\\.\n"
-        "Please wait\\.",
-        parse_mode="MarkdownV2"
-    )
-    
-    # Parse RSS feed
-    feed = feedparser.parse(rss_url)
-    
-    if feed.bozo and not feed.entries:
-        await query.edit_message_text(
-            "❌ Failed to parse RSS feed\\!\n\n"
-            "Please check your RSS URL\\.",
-            parse_mode="MarkdownV2",
-            reply_markup=get_back_keyboard()
-        )
-        return
-    
-    if not feed.entries:
-        await query.edit_message_text(
-            "📡 *RSS Feed Empty*\n\n"
-            "No torrents found in the feed\\.",
-            parse_mode="MarkdownV2",
-            reply_markup=get_back_keyboard()
-        )
-        return
-    
-    # Store feed entries in context
-    context.user_data['rss_entries'] = feed.entries
-    context.user_data['rss_feed_title'] = feed.feed.get('title', feed_name)
-    
-    # Display first page
-    await _display_rss_page(query, context, 0)
+    await query.answer()
+    await _open_feed(query, context, feed_name, rss_url)
 
 
 async def handle_rss_delete(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -279,6 +272,7 @@ async def handle_rss_confirm_delete(update: Update, context: ContextTypes.DEFAUL
     feed_name = query.data.replace("rss_confirm_delete_", "")
     
     if delete_rss_url(chat_id, feed_name):
+        await query.answer()
         escaped_name = escape_markdown_v2(feed_name)
         await query.edit_message_text(
             "━━━━━━━━━━━━━━━━━━━━━━\n"
@@ -290,7 +284,7 @@ async def handle_rss_confirm_delete(update: Update, context: ContextTypes.DEFAUL
             "💡 Use `/setrss <URL> <name>`\n"
             "to add a new feed\\.",
             parse_mode="MarkdownV2",
-            reply_markup=get_back_keyboard()
+            reply_markup=BACK_KEYBOARD
         )
     else:
         await query.answer("❌ Error deleting feed!", show_alert=True)
@@ -313,7 +307,7 @@ async def handle_rss_cancel_delete(update: Update, context: ContextTypes.DEFAULT
         await query.edit_message_text(
             "✅ Operation cancelled\\.",
             parse_mode="MarkdownV2",
-            reply_markup=get_back_keyboard()
+            reply_markup=BACK_KEYBOARD
         )
         return
     
@@ -323,7 +317,7 @@ async def handle_rss_cancel_delete(update: Update, context: ContextTypes.DEFAULT
             InlineKeyboardButton(f"🗑️ {name}", callback_data=f"rss_delete_{name}")
         ])
     
-    keyboard.append([InlineKeyboardButton("🔙 Back", callback_data="menu")])
+    keyboard.append(_BACK_ROW)
     
     await query.edit_message_text(
         "━━━━━━━━━━━━━━━━━━━━━━\n"
@@ -345,58 +339,16 @@ async def handle_rss_browse(update: Update, context: ContextTypes.DEFAULT_TYPE)
     
     if not feeds:
         await query.edit_message_text(
-            "━━━━━━━━━━━━━━━━━━━━━━\n"
-            "📡 *NO RSS FEEDS*\n"
-            "━━━━━━━━━━━━━━━━━━━━━━\n\n"
-            "⚠️ You haven't configured any\n"
-            "RSS feeds yet\\!\n\n"
-            "━━━━━━━━━━━━━━━━━━━━\n\n"
-            "💡 Use `/setrss <URL> <name>`\n"
-            "to add your first RSS feed\\.",
+            NO_RSS_MESSAGE,
             parse_mode="MarkdownV2",
-            reply_markup=get_back_keyboard()
+            reply_markup=BACK_KEYBOARD
         )
         return
     
     # If only one feed, go directly to it
     if len(feeds) == 1:
-        feed_name = list(feeds.keys())[0]
-        context.user_data['rss_current_feed'] = feed_name
-        context.user_data['rss_current_page'] = 0
-        context.user_data['rss_selected'] = set()
-        
-        rss_url = feeds[feed_name]
-        
-        await query.edit_message_text(
-            f"📡 Loading *{escape_markdown_v2(feed_name)}*\\.\\.\\.\n"
-            "Please wait\\.",
-            parse_mode="MarkdownV2"
-        )
-        
-        feed = feedparser.parse(rss_url)
-        
-        if feed.bozo and not feed.entries:
-            await query.edit_message_text(
-                "❌ Failed to parse RSS feed\\!\n\n"
-                "Please check your RSS URL\\.",
-                parse_mode="MarkdownV2",
-                reply_markup=get_back_keyboard()
-            )
-            return
-        
-        if not feed.entries:
-            await query.edit_message_text(
-                "📡 *RSS Feed Empty*\n\n"
-                "No torrents found in the feed\\.",
-                parse_mode="MarkdownV2",
-                reply_markup=get_back_keyboard()
-            )
-            return
-        
-        context.user_data['rss_entries'] = feed.entries
-        context.user_data['rss_feed_title'] = feed.feed.get('title', feed_name)
-        
-        await _display_rss_page(query, context, 0)
+        feed_name, rss_url = next(iter(feeds.items()))
+        await _open_feed(query, context, feed_name, rss_url)
         return
     
     # Multiple feeds - show selection
@@ -406,7 +358,7 @@ async def handle_rss_browse(update: Update, context: ContextTypes.DEFAULT_TYPE)
             InlineKeyboardButton(f"📡 {name}", callback_data=f"rss_select_{name}")
         ])
     
-    keyboard.append([InlineKeyboardButton("🔙 Back", callback_data="menu")])
+    keyboard.append(_BACK_ROW)
     
     await query.edit_message_text(
         "━━━━━━━━━━━━━━━━━━━━━━\n"
@@ -425,10 +377,58 @@ async def handle_rss_page(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     
     try:
         page = int(query.data.split("_")[2])
-        context.user_data['rss_current_page'] = page
-        await _display_rss_page(query, context, page)
     except (ValueError, IndexError):
         await query.answer("❌ Error navigating pages", show_alert=True)
+        return
+    
+    await query.answer()
+    context.user_data['rss_current_page'] = page
+    await _display_rss_page(query, context, page)
+
+
+async def _open_feed(query, context: ContextTypes.DEFAULT_TYPE, feed_name: str, rss_url: str) -> None:
+    """Load an RSS feed into the user's browse context and show its first page."""
+    # Store current feed name in context
+    context.user_data['rss_current_feed'] = feed_name
+    context.user_data['rss_current_page'] = 0
+    context.user_data['rss_selected'] = set()
+    
+    # Show loading
+    await query.edit_message_text(
+        f"📡 Loading *{escape_markdown_v2(feed_name)}*\\.\\.\\.\n"
+        "Please wait\\.",
+        parse_mode="MarkdownV2"
+    )
+    
+    # Parse RSS feed (cached)
+    feed = await get_cached_feed(rss_url)
+    
+    if feed is None:
+        await query.edit_message_text(
+            "❌ Failed to parse RSS feed\\!\n\n"
+            "Please check your RSS URL\\.",
+            parse_mode="MarkdownV2",
+            reply_markup=BACK_KEYBOARD
+        )
+        return
+    
+    entries, feed_title = feed
+    
+    if not entries:
+        await query.edit_message_text(
+            "📡 *RSS Feed Empty*\n\n"
+            "No torrents found in the feed\\.",
+            parse_mode="MarkdownV2",
+            reply_markup=BACK_KEYBOARD
+        )
+        return
+    
+    # Store feed entries in context
+    context.user_data['rss_entries'] = entries
+    context.user_data['rss_feed_title'] = feed_title or feed_name
+    
+    # Display first page
+    await _display_rss_page(query, context, 0)
 
 
 async def _display_rss_page(query, context: ContextTypes.DEFAULT_TYPE, page: int) -> None:
@@ -486,7 +486,7 @@ async def _display_rss_page(query, context: ContextTypes.DEFAULT_TYPE, page: int
         nav_buttons.append(InlineKeyboardButton("Next ▶️", callback_data=f"rss_page_{page+1}"))
     
     keyboard.append(nav_buttons)
-    keyboard.append([InlineKeyboardButton("❌ Cancel", callback_data="rss_cancel")])
+    keyboard.append(_CANCEL_ROW)
     
     escaped_title = escape_markdown_v2(feed_title)
     escaped_feed_name = escape_markdown_v2(feed_name)
@@ -551,14 +551,8 @@ async def handle_rss_cancel(update: Update, context: ContextTypes.DEFAULT_TYPE)
     context.user_data.pop('rss_feed_title', None)
     context.user_data.pop('rss_current_feed', None)
     
-    menu_message = (
-        "━━━━━━━━━━━━━━━━━━━━━━\n"
-        "🎯 *MAIN MENU*\n"
-        "━━━━━━━━━━━━━━━━━━━━━━\n\n"
-        "Select an option below:"
-    )
     await query.edit_message_text(
-        menu_message, parse_mode="MarkdownV2", reply_markup=get_main_menu_keyboard(has_rss=has_rss(chat_id))
+        MENU_MESSAGE, parse_mode="MarkdownV2", reply_markup=get_main_menu_keyboard(has_rss=has_rss(chat_id))
     )
 
 
@@ -604,25 +598,15 @@ async def handle_rss_download(update: Update, context: ContextTypes.DEFAULT_TYPE
                 continue
             
             try:
-                with tempfile.NamedTemporaryFile(suffix='.torrent', delete=False) as temp_file:
-                    temp_path = temp_file.name
-                
-                urllib.request.urlretrieve(torrent_url, temp_path)
-                
-                file_name = f"{torrent_title[:100]}.torrent".replace('/', '_').replace('\\', '_')
-                file_path = os.path.join(WATCH_FOLDER, file_name)
+                file_name = f"{torrent_title[:100]}.torrent".translate(_FILE_NAME_SEPARATORS)
+                file_path = WATCH_FOLDER_PATH / file_name
                 
-                with open(temp_path, 'rb') as src:
-                    with open(file_path, 'wb') as dst:
-                        dst.write(src.read())
-                
-                file_size = os.path.getsize(file_path) / 1024
+                # Fetch, write and rename into the watch folder in a single worker thread
+                async with download_slots:
+                    file_size = await asyncio.to_thread(download_file_atomic, torrent_url, file_path) / 1024
                 downloaded.append((file_name, file_size))
                 
                 logger.info(f"RSS torrent downloaded: {file_name} (from {user_name}, chat ID: {chat_id})")
-                
-                if os.path.exists(temp_path):
-                    os.unlink(temp_path)
                     
             except Exception as e:
                 logger.error(f"Error downloading {torrent_title}: {e}")
@@ -630,38 +614,29 @@ async def handle_rss_download(update: Update, context: ContextTypes.DEFAULT_TYPE
         
         context.user_data['rss_selected'] = set()
         
-        file_list = ""
-        for idx, (name, size) in enumerate(downloaded, 1):
-            escaped_name = escape_markdown_v2(name)
-            file_list += f"{idx}\\. Name: `{escaped_name}`\n"
-            file_list += f"   Size: `{size:.2f} KB`\n"
-            file_list += f"   Status: `QUEUED`\n"
-            if idx < len(downloaded):
-                file_list += "\n"
+        file_list = "\n".join(
+            f"{idx}\\. Name: `{escape_markdown_v2(name)}`\n"
+            f"   Size: `{size:.2f} KB`\n"
+            f"   Status: `QUEUED`\n"
+            for idx, (name, size) in enumerate(downloaded, 1)
+        )
         
         if failed:
-            file_list += "\n\n*Failed:*\n"
-            for idx, name in enumerate(failed, 1):
-                escaped_name = escape_markdown_v2(name)
-                file_list += f"{idx}\\. `{escaped_name}`\n"
+            file_list += "\n\n*Failed:*\n" + "".join(
+                f"{idx}\\. `{escape_markdown_v2(name)}`\n" for idx, name in enumerate(failed, 1)
+            )
         
-        success_msg = "torrent" if len(downloaded) == 1 else "torrents"
+        success_message = RSS_DOWNLOAD_SUCCESS_TEMPLATE.format_map({
+            "count": len(downloaded),
+            "noun": "torrent" if len(downloaded) == 1 else "torrents",
+            "file_list": file_list,
+            "user_name": display_name(user_name),
+        })
         
         await query.edit_message_text(
-            "━━━━━━━━━━━━━━━━━━━━━━\n"
-            "✅ *SUCCESS\\!*\n"
-            "━━━━━━━━━━━━━━━━━━━━━━\n\n"
-            f"🎉 {len(downloaded)} {success_msg} downloaded from RSS\\!\n\n"
-            "┏━━━━━━━━━━━━━━━━━━━━┓\n"
-            "  📁 *Downloaded Files*\n\n"
-            f"{file_list}"
-            "┗━━━━━━━━━━━━━━━━━━━━┛\n\n"
-            "🚀 Your torrent client will pick\n"
-            "them up automatically\\!\n\n"
-            "━━━━━━━━━━━━━━━━━━━━\n"
-            f"💚 Happy downloading, *{user_name}*\\!",
+            success_message,
             parse_mode="MarkdownV2",
-            reply_markup=get_back_keyboard()
+            reply_markup=BACK_KEYBOARD
         )
         
     except Exception as e:
@@ -4,15 +4,10 @@ Send Torrent Telegram Bot
 Receives .torrent files and saves them to a shared folder for torrent clients.
 """
 
-import os
 import asyncio
-import json
-import math
-import feedparser
+import hashlib
 from pathlib import Path
-from typing import Dict, List, Optional
-from datetime import datetime
-from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup, BotCommand
+from telegram import Update, BotCommand
 from telegram.ext import (
     Application,
     CommandHandler,
@@ -26,14 +21,47 @@ from telegram.ext import (
 from bot.config import (
     logger,
     TELEGRAM_BOT_TOKEN,
-    ALLOWED_CHAT_IDS,
-    WATCH_FOLDER,
-    RSS_STORAGE_FILE,
+    WATCH_FOLDER_PATH,
+    COMMANDS_CACHE_FILE,
     BATCH_TIMEOUT,
+    MAX_BATCH,
+    CONNECTION_POOL_SIZE,
+    HTTP_VERSION,
+    POLL_TIMEOUT,
+    BOT_MODE,
+    WEBHOOK_URL,
+    WEBHOOK_LISTEN,
+    WEBHOOK_PORT,
+    WEBHOOK_PATH,
+    WEBHOOK_SECRET,
 )
-from bot.models import TorrentFile, batch_queues, batch_tasks
-from bot.utils import escape_markdown_v2, is_authorized, get_main_menu_keyboard, get_back_keyboard
-from bot.services import has_rss
+from bot.models import TorrentFile, batch_queues, batch_tasks, batch_events, chat_locks, download_slots
+from bot.utils import (
+    escape_markdown_v2,
+    display_name,
+    is_authorized,
+    get_main_menu_keyboard,
+    BACK_KEYBOARD,
+    INVALID_FILE_KEYBOARD,
+    HELP_PROMPT_KEYBOARD,
+    SUCCESS_KEYBOARD,
+    ERROR_KEYBOARD,
+    count_torrents,
+    build_status_message,
+    build_chatid_message,
+    write_file_atomic,
+    MENU_MESSAGE,
+    HELP_MESSAGE,
+    HOWTO_MESSAGE,
+    AUTHOR_MESSAGE,
+    INFO_MESSAGE,
+    INVALID_FILE_MESSAGE,
+    ACCESS_DENIED_TEMPLATE,
+    UPLOAD_ERROR_MESSAGE,
+    UPLOAD_SUCCESS_TEMPLATE,
+    BATCH_SUCCESS_TEMPLATE,
+)
+from bot.services import has_rss, refresh_feeds_forever
 from bot.handlers import (
     start_command,
     help_command,
@@ -68,84 +96,84 @@ async def handle_document(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     if not is_authorized(chat_id):
         logger.warning(f"Unauthorized access attempt from chat ID: {chat_id}")
         await update.message.reply_text(
-            "━━━━━━━━━━━━━━━━━━━━━━\n"
-            "🚫 *ACCESS DENIED*\n"
-            "━━━━━━━━━━━━━━━━━━━━━━\n\n"
-            "⛔ You are not authorized to use\n"
-            "this bot\\.\n\n"
-            "🔑 *Your Chat ID:* `{}`\n\n"
-            "💡 Add this ID to `ALLOWED_CHAT_IDS`\n"
-            "to gain access\\.\n\n"
-            "Use /start for more info\\.".format(chat_id),
+            ACCESS_DENIED_TEMPLATE.format(chat_id),
             parse_mode="MarkdownV2",
         )
         return
 
     document = update.message.document
-    file_name = document.file_name
+    file_name = document.file_name or ""
     file_size = document.file_size / 1024  # KB
 
     # Check if file is a torrent
-    if not file_name.lower().endswith(".torrent"):
-        keyboard = [[InlineKeyboardButton("📖 See Help", callback_data="help")]]
+    if file_name[-8:].lower() != ".torrent":
         await update.message.reply_text(
-            "━━━━━━━━━━━━━━━━━━━━━━\n"
-            "⚠️ *INVALID FILE*\n"
-            "━━━━━━━━━━━━━━━━━━━━━━\n\n"
-            "❌ This is not a torrent file\\!\n\n"
-            "📦 Please send only files with\n"
-            "`.torrent` extension\\.\n\n"
-            "💡 Drag \\& drop your torrent file\n"
-            "or click the attachment button\\.",
+            INVALID_FILE_MESSAGE,
             parse_mode="MarkdownV2",
-            reply_markup=InlineKeyboardMarkup(keyboard),
+            reply_markup=INVALID_FILE_KEYBOARD,
         )
         return
 
-    # Process the torrent file
-    try:
-        file = await context.bot.get_file(document.file_id)
-        file_path = os.path.join(WATCH_FOLDER, file_name)
-        await file.download_to_drive(file_path)
+    # Process files one at a time per chat so batches keep their order,
+    # while other chats are not held up
+    async with chat_locks.setdefault(chat_id, asyncio.Lock()):
+        try:
+            file_path = WATCH_FOLDER_PATH / file_name
+            # Reject names that would escape the watch folder (e.g. "../x.torrent"),
+            # before spending a Bot API request on them
+            if file_path.parent != WATCH_FOLDER_PATH:
+                raise ValueError(f"Invalid file name: {file_name}")
+            file = await context.bot.get_file(document.file_id)
+            # download_to_drive() writes the file on the event loop; do the disk write in a thread,
+            # renaming it into place so torrent clients never pick up a partial file
+            async with download_slots:
+                data = await file.download_as_bytearray()
+                await asyncio.to_thread(write_file_atomic, file_path, data)
+            
+            logger.info(f"Torrent file saved: {file_name} (from {user_name}, chat ID: {chat_id})")
+            
+            torrent_file = TorrentFile(name=file_name, size=file_size, success=True)
+            
+        except Exception as e:
+            logger.error(f"Error saving torrent file: {e}")
+            torrent_file = TorrentFile(name=file_name, size=file_size, success=False, error=str(e))
         
-        logger.info(f"Torrent file saved: {file_name} (from {user_name}, chat ID: {chat_id})")
+        # Add to batch queue
+        batch_queues[chat_id].append(torrent_file)
         
-        torrent_file = TorrentFile(name=file_name, size=file_size, success=True)
+        if len(batch_queues[chat_id]) >= MAX_BATCH:
+            logger.warning(f"Batch limit of {MAX_BATCH} files reached for chat ID: {chat_id}, sending summary now")
         
-    except Exception as e:
-        logger.error(f"Error saving torrent file: {e}")
-        torrent_file = TorrentFile(name=file_name, size=file_size, success=False, error=str(e))
-    
-    # Add to batch queue
-    if chat_id not in batch_queues:
-        batch_queues[chat_id] = []
-    batch_queues[chat_id].append(torrent_file)
-    
-    # Cancel existing batch task if any
-    if chat_id in batch_tasks:
-        batch_tasks[chat_id].cancel()
-    
-    # Create new batch task
-    batch_tasks[chat_id] = asyncio.create_task(
-        send_batch_summary(update, context, chat_id, user_name)
-    )
+        # Restart the pending batch's timer (or flush it when full), or start a new batch
+        if chat_id in batch_tasks:
+            batch_events[chat_id].set()
+        else:
+            batch_events[chat_id] = asyncio.Event()
+            batch_tasks[chat_id] = asyncio.create_task(
+                send_batch_summary(update, context, chat_id, user_name)
+            )
 
 
 async def send_batch_summary(update: Update, context: ContextTypes.DEFAULT_TYPE, chat_id: int, user_name: str) -> None:
     """Send summary of batched torrent files after timeout."""
     try:
-        await asyncio.sleep(BATCH_TIMEOUT)
+        # Wait until no new file has arrived for BATCH_TIMEOUT seconds,
+        # or until the batch is full so the queue can't grow without bound
+        event = batch_events[chat_id]
+        while len(batch_queues[chat_id]) < MAX_BATCH:
+            event.clear()
+            try:
+                await asyncio.wait_for(event.wait(), timeout=BATCH_TIMEOUT)
+            except asyncio.TimeoutError:
+                break
         
-        # Get all files from queue
-        files = batch_queues.get(chat_id, [])
+        # Take all files from queue and end this batch
+        files = batch_queues.pop(chat_id, [])
+        del batch_tasks[chat_id]
+        del batch_events[chat_id]
         if not files:
             return
         
-        # Clear queue
-        batch_queues[chat_id] = []
-        if chat_id in batch_tasks:
-            del batch_tasks[chat_id]
-        
         # Count successes and failures
         successful = [f for f in files if f.success]
         failed = [f for f in files if not f.success]
@@ -154,99 +182,49 @@ async def send_batch_summary(update: Update, context: ContextTypes.DEFAULT_TYPE,
         if len(files) == 1:
             file = files[0]
             if file.success:
-                escaped_name = escape_markdown_v2(file.name)
-                success_message = (
-                    f"━━━━━━━━━━━━━━━━━━━━━━\n"
-                    f"✅ *SUCCESS\\!*\n"
-                    f"━━━━━━━━━━━━━━━━━━━━━━\n\n"
-                    f"🎉 Torrent received and saved\\!\n\n"
-                    f"┏━━━━━━━━━━━━━━━━━━━━┓\n"
-                    f"  📁 *File Details*\n"
-                    f"  • Name: `{escaped_name}`\n"
-                    f"  • Size: `{file.size:.2f} KB`\n"
-                    f"  • Status: `QUEUED`\n"
-                    f"┗━━━━━━━━━━━━━━━━━━━━┛\n\n"
-                    f"🚀 Your torrent client will pick\n"
-                    f"it up automatically\\!\n\n"
-                    f"━━━━━━━━━━━━━━━━━━━━\n"
-                    f"💚 Happy downloading, *{user_name}*\\!"
-                )
-                keyboard = [
-                    [
-                        InlineKeyboardButton("📊 Check Status", callback_data="status"),
-                        InlineKeyboardButton("🔙 Menu", callback_data="menu"),
-                    ]
-                ]
+                success_message = UPLOAD_SUCCESS_TEMPLATE.format_map({
+                    "file_name": escape_markdown_v2(file.name),
+                    "file_size": file.size,
+                    "user_name": display_name(user_name),
+                })
                 await context.bot.send_message(
                     chat_id=chat_id,
                     text=success_message,
                     parse_mode="MarkdownV2",
-                    reply_markup=InlineKeyboardMarkup(keyboard)
+                    reply_markup=SUCCESS_KEYBOARD
                 )
             else:
-                keyboard = [[InlineKeyboardButton("🔄 Try Again", callback_data="menu")]]
                 await context.bot.send_message(
                     chat_id=chat_id,
-                    text=(
-                        "━━━━━━━━━━━━━━━━━━━━━━\n"
-                        "❌ *ERROR*\n"
-                        "━━━━━━━━━━━━━━━━━━━━━━\n\n"
-                        "⚠️ Failed to save the torrent\n"
-                        "file\\. Please try again\\.\n\n"
-                        "🔧 If the problem persists,\n"
-                        "contact the administrator\\."
-                    ),
+                    text=UPLOAD_ERROR_MESSAGE,
                     parse_mode="MarkdownV2",
-                    reply_markup=InlineKeyboardMarkup(keyboard)
+                    reply_markup=ERROR_KEYBOARD
                 )
             return
         
-        # Multiple files - create batch summary
-        total_size = sum(f.size for f in successful)
-        
-        # Build file list - same format as single file
-        file_list = ""
-        for idx, f in enumerate(successful, 1):
-            escaped_name = escape_markdown_v2(f.name)
-            file_list += f"{idx}\\. Name: `{escaped_name}`\n"
-            file_list += f"   Size: `{f.size:.2f} KB`\n"
-            file_list += f"   Status: `QUEUED`\n"
-            if idx < len(successful):
-                file_list += "\n"
+        # Multiple files - create batch summary, same format as single file
+        file_list = "\n".join(
+            f"{idx}\\. Name: `{escape_markdown_v2(f.name)}`\n"
+            f"   Size: `{f.size:.2f} KB`\n"
+            f"   Status: `QUEUED`\n"
+            for idx, f in enumerate(successful, 1)
+        )
         
         if failed:
-            file_list += "\n\n*Failed Files:*\n"
-            for idx, f in enumerate(failed, 1):
-                escaped_name = escape_markdown_v2(f.name)
-                file_list += f"{idx}\\. `{escaped_name}`\n"
+            file_list += "\n\n*Failed Files:*\n" + "".join(
+                f"{idx}\\. `{escape_markdown_v2(f.name)}`\n" for idx, f in enumerate(failed, 1)
+            )
         
-        summary_message = (
-            f"━━━━━━━━━━━━━━━━━━━━━━\n"
-            f"✅ *SUCCESS\\!*\n"
-            f"━━━━━━━━━━━━━━━━━━━━━━\n\n"
-            f"🎉 Multiple torrents received\\!\n\n"
-            f"┏━━━━━━━━━━━━━━━━━━━━┓\n"
-            f"  📁 *Files Processed*\n\n"
-            f"{file_list}"
-            f"┗━━━━━━━━━━━━━━━━━━━━┛\n\n"
-            f"🚀 Your torrent client will pick\n"
-            f"them up automatically\\!\n\n"
-            f"━━━━━━━━━━━━━━━━━━━━\n"
-            f"💚 Happy downloading, *{user_name}*\\!"
-        )
-        
-        keyboard = [
-            [
-                InlineKeyboardButton("📊 Check Status", callback_data="status"),
-                InlineKeyboardButton("🔙 Menu", callback_data="menu"),
-            ]
-        ]
+        summary_message = BATCH_SUCCESS_TEMPLATE.format_map({
+            "file_list": file_list,
+            "user_name": display_name(user_name),
+        })
         
         await context.bot.send_message(
             chat_id=chat_id,
             text=summary_message,
             parse_mode="MarkdownV2",
-            reply_markup=InlineKeyboardMarkup(keyboard)
+            reply_markup=SUCCESS_KEYBOARD
         )
         
     except asyncio.CancelledError:
@@ -254,176 +232,133 @@ async def send_batch_summary(update: Update, context: ContextTypes.DEFAULT_TYPE,
         pass
     except Exception as e:
         logger.error(f"Error sending batch summary: {e}")
+    finally:
+        # Make sure a failed batch doesn't leave a dead task behind
+        if batch_tasks.get(chat_id) is asyncio.current_task():
+            del batch_tasks[chat_id]
+            batch_events.pop(chat_id, None)
 
 
 # ==================== Button Callbacks ====================
 
-async def button_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-    """Handle button callbacks."""
+async def _cb_menu(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Show the main menu."""
+    query = update.callback_query
+    chat_id = query.from_user.id
+
+    await query.edit_message_text(
+        MENU_MESSAGE, parse_mode="MarkdownV2", reply_markup=get_main_menu_keyboard(has_rss=has_rss(chat_id))
+    )
+
+
+async def _cb_help(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Show the help guide."""
     query = update.callback_query
-    await query.answer()
 
+    await query.edit_message_text(
+        HELP_MESSAGE, parse_mode="MarkdownV2", reply_markup=BACK_KEYBOARD
+    )
+
+
+async def _cb_status(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Show the bot status."""
+    query = update.callback_query
     chat_id = query.from_user.id
-    user_name = query.from_user.first_name or "User"
-
-    if query.data == "menu":
-        menu_message = (
-            "━━━━━━━━━━━━━━━━━━━━━━\n"
-            "🎯 *MAIN MENU*\n"
-            "━━━━━━━━━━━━━━━━━━━━━━\n\n"
-            "Select an option below:"
-        )
-        await query.edit_message_text(
-            menu_message, parse_mode="MarkdownV2", reply_markup=get_main_menu_keyboard(has_rss=has_rss(chat_id))
-        )
-    
-    elif query.data == "rss_browse":
-        await handle_rss_browse(update, context)
-    
-    elif query.data.startswith("rss_select_"):
-        await handle_rss_select(update, context)
-    
-    elif query.data.startswith("rss_page_"):
-        await handle_rss_page(update, context)
-    
-    elif query.data.startswith("rss_delete_"):
-        await handle_rss_delete(update, context)
-    
-    elif query.data.startswith("rss_confirm_delete_"):
-        await handle_rss_confirm_delete(update, context)
-    
-    elif query.data == "rss_cancel_delete":
-        await handle_rss_cancel_delete(update, context)
-    
-    elif query.data.startswith("rss_toggle_"):
-        await handle_rss_toggle(update, context)
-    
-    elif query.data == "rss_cancel":
-        await handle_rss_cancel(update, context)
-    
-    elif query.data == "rss_page_info":
-        await handle_rss_page_info(update, context)
-    
-    elif query.data == "rss_download_selected":
-        await handle_rss_download(update, context)
-
-    elif query.data == "help":
-        help_message = (
-            "━━━━━━━━━━━━━━━━━━━━━━\n"
-            "📖 *HELP GUIDE*\n"
-            "━━━━━━━━━━━━━━━━━━━━━━\n\n"
-            "*Available Commands:*\n\n"
-            "🏠 `/start` \\- Main menu \\& welcome\n"
-            "❓ `/help` \\- Show this help guide\n"
-            "📊 `/status` \\- Check bot status\n"
-            "🔍 `/menu` \\- Show interactive menu\n"
-            "📡 `/setrss <URL> <name>` \\- Add RSS\n"
-            "🔎 `/browse` \\- Browse your RSS feeds\n"
-            "🗑️ `/clearrss` \\- Manage RSS feeds\n\n"
-            "━━━━━━━━━━━━━━━━━━━━\n\n"
-            "*Quick Actions:*\n\n"
-            "• Send any `.torrent` file\n"
-            "• Use the menu buttons\n"
-            "• Check your authorization\n"
-            "• Browse your RSS feeds\n\n"
-            "💡 *Tip:* Up to 10 RSS feeds\\!"
-        )
-        await query.edit_message_text(
-            help_message, parse_mode="MarkdownV2", reply_markup=get_back_keyboard()
-        )
 
-    elif query.data == "status":
-        is_auth = is_authorized(chat_id)
-        auth_icon = "✅" if is_auth else "❌"
-        auth_text = "AUTHORIZED" if is_auth else "NOT AUTHORIZED"
+    is_auth = is_authorized(chat_id)
 
-        try:
-            torrent_count = len([f for f in os.listdir(WATCH_FOLDER) if f.endswith(".torrent")])
-        except:
-            torrent_count = 0
-
-        status_message = (
-            f"━━━━━━━━━━━━━━━━━━━━━━\n"
-            f"📊 *BOT STATUS*\n"
-            f"━━━━━━━━━━━━━━━━━━━━━━\n\n"
-            f"🟢 *System:* `ONLINE`\n\n"
-            f"┏━━━━━━━━━━━━━━━━━━━━┓\n"
-            f"  🔑 *Your Access*\n"
-            f"     {auth_icon} `{auth_text}`\n"
-            f"┗━━━━━━━━━━━━━━━━━━━━┛\n\n"
-            f"📁 *Watch Folder:*\n"
-            f"   `{WATCH_FOLDER}`\n\n"
-            f"📊 *Statistics:*\n"
-            f"   • Authorized Users: `{len(ALLOWED_CHAT_IDS)}`\n"
-            f"   • Torrents in Queue: `{torrent_count}`\n\n"
-            f"━━━━━━━━━━━━━━━━━━━━\n"
-            f"🕐 Last checked: `Now`"
-        )
-        await query.edit_message_text(
-            status_message, parse_mode="MarkdownV2", reply_markup=get_back_keyboard()
-        )
+    torrent_count = await asyncio.to_thread(count_torrents)
 
-    elif query.data == "howto":
-        howto_message = (
-            "━━━━━━━━━━━━━━━━━━━━━━\n"
-            "📋 *HOW TO USE*\n"
-            "━━━━━━━━━━━━━━━━━━━━━━\n\n"
-            "*Step\\-by\\-step Guide:*\n\n"
-            "1️⃣ Find a `.torrent` file\n"
-            "2️⃣ Send it to this bot\n"
-            "3️⃣ Wait for confirmation\n"
-            "4️⃣ Check your torrent client\n"
-            "5️⃣ Start downloading\\!\n\n"
-            "━━━━━━━━━━━━━━━━━━━━\n\n"
-            "✨ *Pro Tips:*\n\n"
-            "• Only `.torrent` files accepted\n"
-            "• Files saved instantly\n"
-            "• Auto\\-detected by client\n"
-            "• Check status anytime\n\n"
-            "🎯 It's that simple\\!"
-        )
-        await query.edit_message_text(
-            howto_message, parse_mode="MarkdownV2", reply_markup=get_back_keyboard()
-        )
+    status_message = build_status_message(is_auth, torrent_count)
+    await query.edit_message_text(
+        status_message, parse_mode="MarkdownV2", reply_markup=BACK_KEYBOARD
+    )
 
-    elif query.data == "chatid":
-        chat_id_message = (
-            f"━━━━━━━━━━━━━━━━━━━━━━\n"
-            f"🔑 *YOUR CHAT ID*\n"
-            f"━━━━━━━━━━━━━━━━━━━━━━\n\n"
-            f"👤 *User:* {user_name}\n"
-            f"🆔 *Chat ID:* `{chat_id}`\n\n"
-            f"━━━━━━━━━━━━━━━━━━━━\n\n"
-            f"💡 *Usage:*\n\n"
-            f"Add this ID to the\n"
-            f"`ALLOWED_CHAT_IDS` variable\n"
-            f"in your `.env` file\\.\n\n"
-            f"Example:\n"
-            f"`ALLOWED_CHAT_IDS={chat_id}`\n\n"
-            f"⚠️ Keep this ID private\\!"
-        )
-        await query.edit_message_text(
-            chat_id_message, parse_mode="MarkdownV2", reply_markup=get_back_keyboard()
-        )
 
-    elif query.data == "author":
-        author_message = (
-            "━━━━━━━━━━━━━━━━━━━━━━\n"
-            "👨‍💻 *AUTHOR*\n"
-            "━━━━━━━━━━━━━━━━━━━━━━\n\n"
-            "*Arturo Carretero Calvo*\n\n"
-            "━━━━━━━━━━━━━━━━━━━━\n\n"
-            "💻 *GitHub:*\n"
-            "[github\\.com/ArtCC](https://github.com/ArtCC)\n\n"
-            "🚀 Check out my other projects\\!\n\n"
-            "━━━━━━━━━━━━━━━━━━━━\n\n"
-            "✨ *Built with:*\n"
-            "GitHub Copilot \(Claude Sonnet 4\\.5\)\n\n"
-            "📄 *License:* Apache 2\\.0"
-        )
-        await query.edit_message_text(
-            author_message, parse_mode="MarkdownV2", reply_markup=get_back_keyboard()
-        )
+async def _cb_howto(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Show the how-to guide."""
+    query = update.callback_query
+
+    await query.edit_message_text(
+        HOWTO_MESSAGE, parse_mode="MarkdownV2", reply_markup=BACK_KEYBOARD
+    )
+
+
+async def _cb_chatid(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Show the user's chat ID."""
+    query = update.callback_query
+    chat_id = query.from_user.id
+    user_name = display_name(query.from_user.first_name)
+
+    chat_id_message = build_chatid_message(chat_id, user_name)
+    await query.edit_message_text(
+        chat_id_message, parse_mode="MarkdownV2", reply_markup=BACK_KEYBOARD
+    )
+
+
+async def _cb_author(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Show author information."""
+    query = update.callback_query
+
+    await query.edit_message_text(
+        AUTHOR_MESSAGE, parse_mode="MarkdownV2", reply_markup=BACK_KEYBOARD
+    )
+
+
+# Callbacks matched on the exact callback data
+CALLBACK_HANDLERS = {
+    "menu": _cb_menu,
+    "help": _cb_help,
+    "status": _cb_status,
+    "howto": _cb_howto,
+    "chatid": _cb_chatid,
+    "author": _cb_author,
+    "rss_browse": handle_rss_browse,
+    "rss_cancel_delete": handle_rss_cancel_delete,
+    "rss_cancel": handle_rss_cancel,
+    "rss_page_info": handle_rss_page_info,
+    "rss_download_selected": handle_rss_download,
+}
+
+# Callbacks matched on a callback data prefix, checked in order
+CALLBACK_PREFIX_HANDLERS = (
+    ("rss_select_", handle_rss_select),
+    ("rss_page_", handle_rss_page),
+    ("rss_delete_", handle_rss_delete),
+    ("rss_confirm_delete_", handle_rss_confirm_delete),
+    ("rss_toggle_", handle_rss_toggle),
+)
+
+# Callbacks that answer the query themselves, on every path (own text or an error alert)
+SELF_ANSWERING_HANDLERS = {
+    handle_rss_select,
+    handle_rss_page,
+    handle_rss_toggle,
+    handle_rss_page_info,
+    handle_rss_confirm_delete,
+    handle_rss_download,
+}
+
+
+async def button_callback(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Handle button callbacks."""
+    query = update.callback_query
+
+    handler = CALLBACK_HANDLERS.get(query.data)
+    if handler is None:
+        for prefix, prefix_handler in CALLBACK_PREFIX_HANDLERS:
+            if query.data.startswith(prefix):
+                handler = prefix_handler
+                break
+
+    # Acknowledge the button press in the background while the response is built
+    if handler not in SELF_ANSWERING_HANDLERS:
+        context.application.create_task(query.answer(), update=update)
+
+    if handler:
+        # Button presses in one chat run in order; other chats are not held up
+        async with chat_locks.setdefault(update.effective_chat.id, asyncio.Lock()):
+            await handler(update, context)
 
 
 async def handle_other_messages(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -433,38 +368,68 @@ async def handle_other_messages(update: Update, context: ContextTypes.DEFAULT_TY
     if not is_authorized(chat_id):
         return
 
-    keyboard = [
-        [
-            InlineKeyboardButton("📖 Help", callback_data="help"),
-            InlineKeyboardButton("📋 How to Use", callback_data="howto"),
-        ]
-    ]
-
     await update.message.reply_text(
-        "━━━━━━━━━━━━━━━━━━━━━━\n"
-        "ℹ️ *INFO*\n"
-        "━━━━━━━━━━━━━━━━━━━━━━\n\n"
-        "📦 Please send me a `.torrent` file\\.\n\n"
-        "Use the buttons below for help\\!",
+        INFO_MESSAGE,
         parse_mode="MarkdownV2",
-        reply_markup=InlineKeyboardMarkup(keyboard),
+        reply_markup=HELP_PROMPT_KEYBOARD,
     )
 
 
+# Commands shown in the Telegram menu
+_BOT_COMMANDS = (
+    BotCommand("start", "🏠 Start the bot and show main menu"),
+    BotCommand("menu", "🎯 Show interactive menu"),
+    BotCommand("help", "📖 Show help and usage guide"),
+    BotCommand("status", "📊 Check bot status and info"),
+    BotCommand("chatid", "🔑 Show your Chat ID"),
+    BotCommand("author", "👨‍💻 About the author"),
+    BotCommand("setrss", "📡 Add RSS feed: /setrss <URL> <name>"),
+    BotCommand("browse", "🔎 Browse your RSS feeds"),
+    BotCommand("clearrss", "🗑️ Manage and delete RSS feeds"),
+)
+
+# Identifies this command list for this bot, to skip pushing it again unchanged
+_BOT_COMMANDS_HASH = hashlib.sha256(
+    repr((TELEGRAM_BOT_TOKEN, [(c.command, c.description) for c in _BOT_COMMANDS])).encode()
+).hexdigest()
+
+
 async def setup_bot_commands(application: Application) -> None:
     """Set up bot commands for the menu."""
-    commands = [
-        BotCommand("start", "🏠 Start the bot and show main menu"),
-        BotCommand("menu", "🎯 Show interactive menu"),
-        BotCommand("help", "📖 Show help and usage guide"),
-        BotCommand("status", "📊 Check bot status and info"),
-        BotCommand("chatid", "🔑 Show your Chat ID"),
-        BotCommand("author", "👨‍💻 About the author"),
-        BotCommand("setrss", "📡 Add RSS feed: /setrss <URL> <name>"),
-        BotCommand("browse", "🔎 Browse your RSS feeds"),
-        BotCommand("clearrss", "🗑️ Manage and delete RSS feeds"),
-    ]
-    await application.bot.set_my_commands(commands)
+    # Skip the API call when the same command list was already pushed for this bot
+    cache_file = Path(COMMANDS_CACHE_FILE)
+    try:
+        if cache_file.read_text().strip() == _BOT_COMMANDS_HASH:
+            logger.info("Bot commands unchanged, skipping update")
+            return
+    except OSError:
+        pass
+
+    await application.bot.set_my_commands(_BOT_COMMANDS)
+
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(_BOT_COMMANDS_HASH)
+    except OSError as e:
+        logger.warning(f"Could not write bot commands cache: {e}")
+
+
+async def post_init(application: Application) -> None:
+    """Set up bot commands and start background jobs once the bot is initialized."""
+    await setup_bot_commands(application)
+    # Not application.create_task(): the app isn't running yet, so it wouldn't be tracked
+    application.bot_data['rss_refresher'] = asyncio.create_task(refresh_feeds_forever())
+
+
+async def post_stop(application: Application) -> None:
+    """Stop background jobs."""
+    refresher = application.bot_data.pop('rss_refresher', None)
+    if refresher:
+        refresher.cancel()
+        try:
+            await refresher
+        except asyncio.CancelledError:
+            pass
 
 
 def main() -> None:
@@ -472,28 +437,60 @@ def main() -> None:
     logger.info("Starting Send Torrent Telegram Bot...")
 
     # Create application
-    application = Application.builder().token(TELEGRAM_BOT_TOKEN).build()
+    application = (
+        Application.builder()
+        .token(TELEGRAM_BOT_TOKEN)
+        .connection_pool_size(CONNECTION_POOL_SIZE)
+        .http_version(HTTP_VERSION)
+        # Handle updates from different chats in parallel; per-chat ordering
+        # is kept by chat_locks in the handlers that do slow work
+        .concurrent_updates(True)
+        .build()
+    )
 
-    # Set up bot commands
-    application.post_init = setup_bot_commands
+    # Set up bot commands and background jobs
+    application.post_init = post_init
+    application.post_stop = post_stop
 
     # Add handlers
-    application.add_handler(CommandHandler("start", start_command))
-    application.add_handler(CommandHandler("help", help_command))
-    application.add_handler(CommandHandler("status", status_command))
-    application.add_handler(CommandHandler("menu", menu_command))
-    application.add_handler(CommandHandler("chatid", chatid_command))
-    application.add_handler(CommandHandler("author", author_command))
-    application.add_handler(CommandHandler("setrss", setrss_command))
-    application.add_handler(CommandHandler("browse", browse_command))
-    application.add_handler(CommandHandler("clearrss", clearrss_command))
-    application.add_handler(CallbackQueryHandler(button_callback))
-    application.add_handler(MessageHandler(filters.Document.ALL, handle_document))
-    application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, handle_other_messages))
+    application.add_handlers([
+        CommandHandler("start", start_command),
+        CommandHandler("help", help_command),
+        CommandHandler("status", status_command),
+        CommandHandler("menu", menu_command),
+        CommandHandler("chatid", chatid_command),
+        CommandHandler("author", author_command),
+        CommandHandler("setrss", setrss_command),
+        CommandHandler("browse", browse_command),
+        CommandHandler("clearrss", clearrss_command),
+        CallbackQueryHandler(button_callback),
+        MessageHandler(filters.Document.ALL, handle_document),
+        MessageHandler(filters.TEXT & ~filters.COMMAND, handle_other_messages),
+    ])
+
+    # Only the update types the handlers above use
+    allowed_updates = [Update.MESSAGE, Update.CALLBACK_QUERY]
 
     # Start the bot
-    logger.info("Bot is running...")
-    application.run_polling(allowed_updates=Update.ALL_TYPES)
+    logger.info(f"Bot is running ({BOT_MODE})...")
+    if BOT_MODE == "webhook":
+        # Telegram pushes updates, so there are no getUpdates round-trips while idle.
+        # Requests are authenticated by the secret token header, not by the URL,
+        # so nothing sensitive ends up in proxy access logs.
+        application.run_webhook(
+            listen=WEBHOOK_LISTEN,
+            port=WEBHOOK_PORT,
+            url_path=WEBHOOK_PATH,
+            webhook_url=f"{WEBHOOK_URL}/{WEBHOOK_PATH}",
+            secret_token=WEBHOOK_SECRET,
+            allowed_updates=allowed_updates,
+        )
+    else:
+        # Long polling
+        application.run_polling(
+            timeout=POLL_TIMEOUT,
+            allowed_updates=allowed_updates,
+        )
 
 
 if __name__ == "__main__":
@@ -3,6 +3,6 @@ Bot Models Package
 Data classes and type definitions.
 """
 
-from bot.models.models import TorrentFile, batch_queues, batch_tasks
+from bot.models.models import TorrentFile, batch_queues, batch_tasks, batch_events, chat_locks, download_slots
 
-__all__ = ['TorrentFile', 'batch_queues', 'batch_tasks']
+__all__ = ['TorrentFile', 'batch_queues', 'batch_tasks', 'batch_events', 'chat_locks', 'download_slots']
@@ -4,11 +4,14 @@ Data classes and type definitions.
 """
 
 import asyncio
+from collections import defaultdict
 from dataclasses import dataclass
-from typing import Dict, List
+from typing import DefaultDict, Dict, List
 
+from bot.config import MAX_CONCURRENT_DOWNLOADS
 
-@dataclass
+
+@dataclass(slots=True)
 class TorrentFile:
     """Represents a torrent file to be processed."""
     name: str
@@ -18,5 +21,13 @@ class TorrentFile:
 
 
 # Batch processing state
-batch_queues: Dict[int, List[TorrentFile]] = {}
+batch_queues: DefaultDict[int, List[TorrentFile]] = defaultdict(list)
 batch_tasks: Dict[int, asyncio.Task] = {}
+batch_events: Dict[int, asyncio.Event] = {}  # set when a file arrives to restart the batch timer
+
+# Per-chat locks to keep updates ordered within a chat
+chat_locks: Dict[int, asyncio.Lock] = {}
+
+# Shared limit on torrent downloads in progress, so bursts queue up instead of
+# all hitting the network and the watch folder at once
+download_slots = asyncio.Semaphore(MAX_CONCURRENT_DOWNLOADS)
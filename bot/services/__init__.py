@@ -13,6 +13,7 @@ from bot.services.rss_manager import (
     has_rss,
     MAX_RSS_FEEDS,
 )
+from bot.services.feed_cache import get_cached_feed, refresh_feeds_forever
 
 __all__ = [
     'load_rss_data',
@@ -23,4 +24,6 @@ __all__ = [
     'get_rss_count',
     'has_rss',
     'MAX_RSS_FEEDS',
+    'get_cached_feed',
+    'refresh_feeds_forever',
 ]
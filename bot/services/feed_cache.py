@@ -0,0 +1,140 @@
+"""
+RSS Feed Cache Service
+Fetches RSS feeds and keeps the parsed result for a short time.
+"""
+
+import asyncio
+import random
+import time
+import urllib.error
+import urllib.request
+from typing import Dict, List, Optional, Tuple
+
+import feedparser
+
+from bot.config import logger
+from bot.services.rss_manager import load_rss_data
+
+# Seconds a parsed feed is reused before it is fetched again
+RSS_CACHE_TTL = 120
+
+# Seconds between background refreshes of every configured feed, plus up to
+# RSS_REFRESH_JITTER extra so refreshes don't line up with other clients
+RSS_REFRESH_INTERVAL = 300
+RSS_REFRESH_JITTER = 30
+
+# Seconds a feed request may stall before it is abandoned
+RSS_FETCH_TIMEOUT = 30
+
+# Entry fields used by the RSS browser; everything else feedparser returns is dropped
+ENTRY_FIELDS = ('title', 'link', 'category')
+
+# Parsed feeds: {rss_url: (expires_at, entries, feed_title, etag, modified)}
+_rss_cache: Dict[str, Tuple[float, List, str, Optional[str], Optional[str]]] = {}
+
+# Fetches currently running: {rss_url: task}
+_inflight: Dict[str, asyncio.Task] = {}
+
+
+async def get_cached_feed(rss_url: str) -> Optional[Tuple[List, str]]:
+    """
+    Get the entries and title of an RSS feed, fetching it at most once per RSS_CACHE_TTL.
+    Returns None if the feed could not be parsed.
+    """
+    cached = _rss_cache.get(rss_url)
+    if cached and time.monotonic() < cached[0]:
+        return cached[1], cached[2]
+
+    return await _fetch_shared(rss_url, RSS_CACHE_TTL)
+
+
+async def _fetch_shared(rss_url: str, ttl: float) -> Optional[Tuple[List, str]]:
+    """Fetch a feed, letting callers that arrive while it is being fetched share that fetch."""
+    task = _inflight.get(rss_url)
+    if task is None:
+        task = asyncio.ensure_future(_fetch_feed(rss_url, _rss_cache.get(rss_url), ttl))
+        _inflight[rss_url] = task
+        task.add_done_callback(lambda _: _inflight.pop(rss_url, None))
+
+    # Shielded so one caller giving up doesn't cancel the fetch for the others
+    return await asyncio.shield(task)
+
+
+async def _fetch_feed(rss_url: str, cached: Optional[Tuple], ttl: float) -> Optional[Tuple[List, str]]:
+    """Fetch and parse an RSS feed, updating the cache."""
+    # Send the previous validators so unchanged feeds come back as 304 Not Modified
+    etag = cached[3] if cached else None
+    modified = cached[4] if cached else None
+
+    # Blocking download (with a timeout) and parse, both kept off the event loop.
+    # feedparser's own fetching has no timeout, and a stalled fetch would block
+    # every caller sharing it.
+    try:
+        status, feed, headers = await asyncio.to_thread(_download_feed, rss_url, etag, modified)
+    except Exception as e:
+        logger.warning(f"Failed to fetch RSS feed {rss_url}: {e}")
+        return None
+
+    if cached and status == 304:
+        _rss_cache[rss_url] = (time.monotonic() + ttl,) + cached[1:]
+        return cached[1], cached[2]
+
+    if feed.bozo and not feed.entries:
+        logger.warning(f"Failed to parse RSS feed {rss_url}: {feed.get('bozo_exception')}")
+        return None
+
+    # Keep only the fields the browser reads, not feedparser's full nested entries
+    entries = [
+        {field: entry[field] for field in ENTRY_FIELDS if field in entry}
+        for entry in feed.entries
+    ]
+    feed_title = feed.feed.get('title', '')
+    _rss_cache[rss_url] = (
+        time.monotonic() + ttl, entries, feed_title, headers.get('etag'), headers.get('last-modified')
+    )
+    return entries, feed_title
+
+
+def _download_feed(
+    rss_url: str, etag: Optional[str], modified: Optional[str]
+) -> Tuple[int, Optional[feedparser.FeedParserDict], Dict[str, str]]:
+    """Download and parse a feed. Returns (status, feed, lowercased headers); 304 has no feed."""
+    request = urllib.request.Request(rss_url, headers={'User-Agent': feedparser.USER_AGENT})
+    if etag:
+        request.add_header('If-None-Match', etag)
+    if modified:
+        request.add_header('If-Modified-Since', modified)
+    try:
+        with urllib.request.urlopen(request, timeout=RSS_FETCH_TIMEOUT) as response:
+            headers = {key.lower(): value for key, value in response.headers.items()}
+            data = response.read()
+            # Final URL after redirects, so relative item links resolve against it
+            base_url = response.url
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            return 304, None, {}
+        raise
+    feed = feedparser.parse(data, response_headers={**headers, 'content-location': base_url})
+    return response.status, feed, headers
+
+
+async def refresh_feeds_forever() -> None:
+    """
+    Keep every configured feed parsed in the cache, so browsing is a cache hit.
+    Runs until cancelled; each feed is refreshed once per RSS_REFRESH_INTERVAL (plus jitter).
+    """
+    # Refreshed entries stay valid until the next round has had time to run
+    ttl = RSS_REFRESH_INTERVAL + RSS_REFRESH_JITTER * 2
+    while True:
+        rss_urls = {url for feeds in load_rss_data().values() for url in feeds.values()}
+        for rss_url in rss_urls:
+            try:
+                # Bounded as a whole, so one stalled feed can't hold up the rest of the round
+                await asyncio.wait_for(_fetch_shared(rss_url, ttl), RSS_FETCH_TIMEOUT * 2)
+            except asyncio.TimeoutError:
+                logger.warning(f"Background refresh of RSS feed {rss_url} timed out")
+            except Exception as e:
+                logger.warning(f"Background refresh of RSS feed {rss_url} failed: {e}")
+            # Spread requests out instead of hitting every feed at once
+            await asyncio.sleep(random.uniform(0, 2))
+        await asyncio.sleep(RSS_REFRESH_INTERVAL + random.uniform(0, RSS_REFRESH_JITTER))
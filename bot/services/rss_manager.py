@@ -5,43 +5,92 @@ Handles RSS feed URL storage and retrieval.
 
 import os
 import json
+import tempfile
+from pathlib import Path
 from typing import Dict, Optional, List, Tuple
 
 from bot.config import logger, RSS_STORAGE_FILE
 
+# orjson (in requirements.txt) parses and serializes straight to bytes, several times faster
+# than json; the stdlib fallback keeps the bot working where it is not installed
+try:
+    import orjson
+
+    def _loads(raw: bytes):
+        return orjson.loads(raw)
+
+    def _dumps(data) -> bytes:
+        return orjson.dumps(data)
+except ImportError:
+    def _loads(raw: bytes):
+        return json.loads(raw)
+
+    def _dumps(data) -> bytes:
+        # Compact separators: the file is only read by the bot, keep writes small
+        return json.dumps(data, separators=(',', ':')).encode()
+
 # Maximum number of RSS feeds per user
 MAX_RSS_FEEDS = 10
 
 
-def load_rss_data() -> Dict[int, Dict[str, str]]:
-    """Load RSS data from JSON file. Returns {chat_id: {name: url}}."""
+# Parsed RSS data and the storage file's mtime when it was read or written;
+# the file is only parsed again if it changes on disk (e.g. edited by hand).
+# Chat IDs are kept as strings, the same as the JSON keys, and converted once per call.
+_rss_cache: Optional[Dict[str, Dict[str, str]]] = None
+_rss_cache_mtime_ns: Optional[int] = None
+
+
+def _storage_mtime_ns() -> Optional[int]:
+    """Get the storage file's mtime in nanoseconds, or None if it doesn't exist."""
     try:
-        if os.path.exists(RSS_STORAGE_FILE):
-            with open(RSS_STORAGE_FILE, 'r') as f:
-                data = json.load(f)
-                # Convert string keys back to integers and handle migration
-                result = {}
-                for k, v in data.items():
-                    chat_id = int(k)
-                    # Migration: if v is a string (old format), convert to new format
-                    if isinstance(v, str):
-                        result[chat_id] = {"RSS Feed": v}
-                    else:
-                        result[chat_id] = v
-                return result
-        return {}
+        return os.stat(RSS_STORAGE_FILE).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def load_rss_data() -> Dict[str, Dict[str, str]]:
+    """Load RSS data (cached until the file changes). Returns {str(chat_id): {name: url}}."""
+    global _rss_cache, _rss_cache_mtime_ns
+    try:
+        mtime_ns = _storage_mtime_ns()
+        if _rss_cache is not None and mtime_ns == _rss_cache_mtime_ns:
+            return _rss_cache
+        
+        result = {}
+        if mtime_ns is not None:
+            with open(RSS_STORAGE_FILE, 'rb') as f:
+                result = _loads(f.read())
+            # Migration: if a value is a string (old format), convert to new format
+            for key, value in result.items():
+                if isinstance(value, str):
+                    result[key] = {"RSS Feed": value}
+        _rss_cache = result
+        _rss_cache_mtime_ns = mtime_ns
+        return result
     except Exception as e:
         logger.error(f"Error loading RSS data: {e}")
         return {}
 
 
-def _save_rss_data(data: Dict[int, Dict[str, str]]) -> None:
-    """Save RSS data to JSON file."""
+def _save_rss_data(data: Dict[str, Dict[str, str]]) -> None:
+    """Save RSS data to JSON file atomically and update the cache."""
+    global _rss_cache, _rss_cache_mtime_ns
+    storage_dir = os.path.dirname(os.path.abspath(RSS_STORAGE_FILE))
+    temp_path = None
     try:
-        with open(RSS_STORAGE_FILE, 'w') as f:
-            json.dump({str(k): v for k, v in data.items()}, f, indent=2)
+        # Write to a temp file in the same directory, then swap it in with os.replace
+        with tempfile.NamedTemporaryFile('wb', dir=storage_dir, suffix='.tmp', delete=False) as f:
+            temp_path = f.name
+            f.write(_dumps(data))
+        os.replace(temp_path, RSS_STORAGE_FILE)
+        _rss_cache = data
+        _rss_cache_mtime_ns = _storage_mtime_ns()
     except Exception as e:
         logger.error(f"Error saving RSS data: {e}")
+        # The cached dict may hold unsaved changes, reload from disk next time
+        _rss_cache = None
+        if temp_path:
+            Path(temp_path).unlink(missing_ok=True)
         raise
 
 
@@ -52,18 +101,18 @@ def save_rss_url(chat_id: int, name: str, rss_url: str) -> Tuple[bool, str]:
     """
     try:
         data = load_rss_data()
-        
-        if chat_id not in data:
-            data[chat_id] = {}
-        
-        user_feeds = data[chat_id]
+        key = str(chat_id)
+        user_feeds = data.get(key, {})
         
         # Check limit only if adding new (not updating existing)
         if name not in user_feeds and len(user_feeds) >= MAX_RSS_FEEDS:
             return False, f"Has alcanzado el límite de {MAX_RSS_FEEDS} feeds RSS"
         
-        user_feeds[name] = rss_url
-        _save_rss_data(data)
+        # Nothing to write if the feed is already saved with this URL
+        if user_feeds.get(name) != rss_url:
+            user_feeds[name] = rss_url
+            data[key] = user_feeds
+            _save_rss_data(data)
         logger.info(f"RSS URL '{name}' saved for chat ID {chat_id}")
         return True, "RSS guardado correctamente"
     except Exception as e:
@@ -75,11 +124,12 @@ def delete_rss_url(chat_id: int, name: str) -> bool:
     """Delete RSS URL by name for a chat ID. Returns True if deleted."""
     try:
         data = load_rss_data()
-        if chat_id in data and name in data[chat_id]:
-            del data[chat_id][name]
+        key = str(chat_id)
+        if key in data and name in data[key]:
+            del data[key][name]
             # Clean up empty dict
-            if not data[chat_id]:
-                del data[chat_id]
+            if not data[key]:
+                del data[key]
             _save_rss_data(data)
             logger.info(f"RSS URL '{name}' deleted for chat ID {chat_id}")
             return True
@@ -92,7 +142,7 @@ def delete_rss_url(chat_id: int, name: str) -> bool:
 def get_rss_url(chat_id: int, name: str = None) -> Optional[str]:
     """Get RSS URL by name for a chat ID. If name is None, returns first RSS (for compatibility)."""
     data = load_rss_data()
-    user_feeds = data.get(chat_id, {})
+    user_feeds = data.get(str(chat_id), {})
     
     if name:
         return user_feeds.get(name)
@@ -106,15 +156,14 @@ def get_rss_url(chat_id: int, name: str = None) -> Optional[str]:
 def get_all_rss(chat_id: int) -> Dict[str, str]:
     """Get all RSS feeds for a chat ID. Returns {name: url}."""
     data = load_rss_data()
-    return data.get(chat_id, {})
+    return data.get(str(chat_id), {})
 
 
 def get_rss_count(chat_id: int) -> int:
     """Get the number of RSS feeds for a chat ID."""
-    data = load_rss_data()
-    return len(data.get(chat_id, {}))
+    return len(load_rss_data().get(str(chat_id)) or ())
 
 
 def has_rss(chat_id: int) -> bool:
     """Check if user has any RSS feeds."""
-    return get_rss_count(chat_id) > 0
+    return bool(load_rss_data().get(str(chat_id)))
@@ -3,13 +3,67 @@ Bot Utilities
 Helper functions and utilities.
 """
 
-from bot.utils.formatting import escape_markdown_v2
+from bot.utils.formatting import escape_markdown_v2, display_name
 from bot.utils.auth import is_authorized
-from bot.utils.keyboards import get_main_menu_keyboard, get_back_keyboard
+from bot.utils.keyboards import (
+    get_main_menu_keyboard,
+    BACK_KEYBOARD,
+    INVALID_FILE_KEYBOARD,
+    HELP_PROMPT_KEYBOARD,
+    SUCCESS_KEYBOARD,
+    ERROR_KEYBOARD,
+)
+from bot.utils.messages import (
+    build_status_message,
+    build_chatid_message,
+    build_welcome_message,
+    MENU_MESSAGE,
+    HELP_MESSAGE,
+    HOWTO_MESSAGE,
+    AUTHOR_MESSAGE,
+    INFO_MESSAGE,
+    INVALID_FILE_MESSAGE,
+    UNAUTHORIZED_MESSAGE,
+    NO_RSS_MESSAGE,
+    ACCESS_DENIED_TEMPLATE,
+    UPLOAD_ERROR_MESSAGE,
+    UPLOAD_SUCCESS_TEMPLATE,
+    BATCH_SUCCESS_TEMPLATE,
+    RSS_DOWNLOAD_SUCCESS_TEMPLATE,
+)
+from bot.utils.watch_folder import (
+    count_torrents,
+    write_file_atomic,
+    download_file_atomic,
+)
 
 __all__ = [
     'escape_markdown_v2',
+    'display_name',
     'is_authorized',
     'get_main_menu_keyboard',
-    'get_back_keyboard',
+    'BACK_KEYBOARD',
+    'INVALID_FILE_KEYBOARD',
+    'HELP_PROMPT_KEYBOARD',
+    'SUCCESS_KEYBOARD',
+    'ERROR_KEYBOARD',
+    'build_status_message',
+    'build_chatid_message',
+    'build_welcome_message',
+    'MENU_MESSAGE',
+    'HELP_MESSAGE',
+    'HOWTO_MESSAGE',
+    'AUTHOR_MESSAGE',
+    'INFO_MESSAGE',
+    'INVALID_FILE_MESSAGE',
+    'UNAUTHORIZED_MESSAGE',
+    'NO_RSS_MESSAGE',
+    'ACCESS_DENIED_TEMPLATE',
+    'UPLOAD_ERROR_MESSAGE',
+    'UPLOAD_SUCCESS_TEMPLATE',
+    'BATCH_SUCCESS_TEMPLATE',
+    'RSS_DOWNLOAD_SUCCESS_TEMPLATE',
+    'count_torrents',
+    'write_file_atomic',
+    'download_file_atomic',
 ]
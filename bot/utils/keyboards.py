@@ -3,32 +3,47 @@ Keyboard Utilities
 Helper functions for creating inline keyboards.
 """
 
-from typing import Optional
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup
 
+# Static keyboards, built once and shared by every handler
+BACK_KEYBOARD = InlineKeyboardMarkup([[InlineKeyboardButton("🔙 Back to Menu", callback_data="menu")]])
 
-def get_main_menu_keyboard(chat_id: Optional[int] = None, has_rss: bool = False) -> InlineKeyboardMarkup:
-    """Create the main menu keyboard with inline buttons."""
-    keyboard = [
-        [
-            InlineKeyboardButton("ℹ️ Help", callback_data="help"),
-            InlineKeyboardButton("📊 Status", callback_data="status"),
-        ],
-        [
-            InlineKeyboardButton("📋 How to Use", callback_data="howto"),
-        ],
+INVALID_FILE_KEYBOARD = InlineKeyboardMarkup([[InlineKeyboardButton("📖 See Help", callback_data="help")]])
+
+HELP_PROMPT_KEYBOARD = InlineKeyboardMarkup([
+    [
+        InlineKeyboardButton("📖 Help", callback_data="help"),
+        InlineKeyboardButton("📋 How to Use", callback_data="howto"),
+    ]
+])
+
+SUCCESS_KEYBOARD = InlineKeyboardMarkup([
+    [
+        InlineKeyboardButton("📊 Check Status", callback_data="status"),
+        InlineKeyboardButton("🔙 Menu", callback_data="menu"),
     ]
-    
-    # Add RSS button if user has RSS configured
-    if has_rss:
-        keyboard.append([
-            InlineKeyboardButton("📡 Browse RSS Feed", callback_data="rss_browse")
-        ])
-    
-    return InlineKeyboardMarkup(keyboard)
-
-
-def get_back_keyboard() -> InlineKeyboardMarkup:
-    """Create a keyboard with a back button."""
-    keyboard = [[InlineKeyboardButton("🔙 Back to Menu", callback_data="menu")]]
-    return InlineKeyboardMarkup(keyboard)
+])
+
+ERROR_KEYBOARD = InlineKeyboardMarkup([[InlineKeyboardButton("🔄 Try Again", callback_data="menu")]])
+
+
+_BASE_MENU_ROWS = [
+    [
+        InlineKeyboardButton("ℹ️ Help", callback_data="help"),
+        InlineKeyboardButton("📊 Status", callback_data="status"),
+    ],
+    [
+        InlineKeyboardButton("📋 How to Use", callback_data="howto"),
+    ],
+]
+
+# Shown only to users with an RSS feed configured
+_RSS_ROW = [InlineKeyboardButton("📡 Browse RSS Feed", callback_data="rss_browse")]
+
+_MENU_NO_RSS = InlineKeyboardMarkup(_BASE_MENU_ROWS)
+_MENU_WITH_RSS = InlineKeyboardMarkup(_BASE_MENU_ROWS + [_RSS_ROW])
+
+
+def get_main_menu_keyboard(has_rss: bool = False) -> InlineKeyboardMarkup:
+    """Return the main menu keyboard with inline buttons."""
+    return _MENU_WITH_RSS if has_rss else _MENU_NO_RSS
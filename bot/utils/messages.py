@@ -0,0 +1,257 @@
+"""
+Message Utilities
+Static MarkdownV2 message bodies and builders shared by several handlers.
+"""
+
+from functools import lru_cache
+
+from bot.config import ALLOWED_CHAT_IDS, WATCH_FOLDER
+from bot.utils.formatting import escape_markdown_v2
+
+# Static message bodies, shared by the commands and their menu buttons
+MENU_MESSAGE = (
+    "━━━━━━━━━━━━━━━━━━━━━━\n"
+    "🎯 *MAIN MENU*\n"
+    "━━━━━━━━━━━━━━━━━━━━━━\n\n"
+    "Select an option below:"
+)
+
+HELP_MESSAGE = (
+    "━━━━━━━━━━━━━━━━━━━━━━\n"
+    "📖 *HELP GUIDE*\n"
+    "━━━━━━━━━━━━━━━━━━━━━━\n\n"
+    "*Available Commands:*\n\n"
+    "🏠 `/start` \\- Main menu \\& welcome\n"
+    "❓ `/help` \\- Show this help guide\n"
+    "📊 `/status` \\- Check bot status\n"
+    "🔍 `/menu` \\- Show interactive menu\n"
+    "📡 `/setrss <URL> <name>` \\- Add RSS\n"
+    "🔎 `/browse` \\- Browse your RSS feeds\n"
+    "🗑️ `/clearrss` \\- Manage RSS feeds\n\n"
+    "━━━━━━━━━━━━━━━━━━━━\n\n"
+    "*Quick Actions:*\n\n"
+    "• Send any `.torrent` file\n"
+    "• Use the menu buttons\n"
+    "• Check your authorization\n"
+    "• Browse your RSS feeds\n\n"
+    "💡 *Tip:* Up to 10 RSS feeds\\!"
+)
+
+HOWTO_MESSAGE = (
+    "━━━━━━━━━━━━━━━━━━━━━━\n"
+    "📋 *HOW TO USE*\n"
+    "━━━━━━━━━━━━━━━━━━━━━━\n\n"
+    "*Step\\-by\\-step Guide:*\n\n"
+    "1️⃣ Find a `.torrent` file\n"
+    "2️⃣ Send it to this bot\n"
+    "3️⃣ Wait for confirmation\n"
+    "4️⃣ Check your torrent client\n"
+    "5️⃣ Start downloading\\!\n\n"
+    "━━━━━━━━━━━━━━━━━━━━\n\n"
+    "✨ *Pro Tips:*\n\n"
+    "• Only `.torrent` files accepted\n"
+    "• Files saved instantly\n"
+    "• Auto\\-detected by client\n"
+    "• Check status anytime\n\n"
+    "🎯 It's that simple\\!"
+)
+
+AUTHOR_MESSAGE = (
+    "━━━━━━━━━━━━━━━━━━━━━━\n"
+    "👨‍💻 *AUTHOR*\n"
+    "━━━━━━━━━━━━━━━━━━━━━━\n\n"
+    "*Arturo Carretero Calvo*\n\n"
+    "━━━━━━━━━━━━━━━━━━━━\n\n"
+    "💻 *GitHub:*\n"
+    "[github\\.com/ArtCC](https://github.com/ArtCC)\n\n"
+    "🚀 Check out my other projects\\!\n\n"
+    "━━━━━━━━━━━━━━━━━━━━\n\n"
+    "✨ *Built with:*\n"
+    "GitHub Copilot \\(Claude Sonnet 4\\.5\\)\n\n"
+    "📄 *License:* Apache 2\\.0"
+)
+
+INFO_MESSAGE = (
+    "━━━━━━━━━━━━━━━━━━━━━━\n"
+    "ℹ️ *INFO*\n"
+    "━━━━━━━━━━━━━━━━━━━━━━\n\n"
+    "📦 Please send me a `.torrent` file\\.\n\n"
+    "Use the buttons below for help\\!"
+)
+
+INVALID_FILE_MESSAGE = (
+    "━━━━━━━━━━━━━━━━━━━━━━\n"
+    "⚠️ *INVALID FILE*\n"
+    "━━━━━━━━━━━━━━━━━━━━━━\n\n"
+    "❌ This is not a torrent file\\!\n\n"
+    "📦 Please send only files with\n"
+    "`.torrent` extension\\.\n\n"
+    "💡 Drag \\& drop your torrent file\n"
+    "or click the attachment button\\."
+)
+
+UNAUTHORIZED_MESSAGE = "⛔ You are not authorized to use this bot\\."
+
+NO_RSS_MESSAGE = (
+    "━━━━━━━━━━━━━━━━━━━━━━\n"
+    "📡 *NO RSS FEEDS*\n"
+    "━━━━━━━━━━━━━━━━━━━━━━\n\n"
+    "⚠️ You haven't configured any\n"
+    "RSS feeds yet\\!\n\n"
+    "━━━━━━━━━━━━━━━━━━━━\n\n"
+    "💡 Use `/setrss <URL> <name>`\n"
+    "to add your first RSS feed\\."
+)
+
+UPLOAD_ERROR_MESSAGE = (
+    "━━━━━━━━━━━━━━━━━━━━━━\n"
+    "❌ *ERROR*\n"
+    "━━━━━━━━━━━━━━━━━━━━━━\n\n"
+    "⚠️ Failed to save the torrent\n"
+    "file\\. Please try again\\.\n\n"
+    "🔧 If the problem persists,\n"
+    "contact the administrator\\."
+)
+
+# Success templates filled in via .format_map() with already escaped values
+UPLOAD_SUCCESS_TEMPLATE = (
+    "━━━━━━━━━━━━━━━━━━━━━━\n"
+    "✅ *SUCCESS\\!*\n"
+    "━━━━━━━━━━━━━━━━━━━━━━\n\n"
+    "🎉 Torrent received and saved\\!\n\n"
+    "┏━━━━━━━━━━━━━━━━━━━━┓\n"
+    "  📁 *File Details*\n"
+    "  • Name: `{file_name}`\n"
+    "  • Size: `{file_size:.2f} KB`\n"
+    "  • Status: `QUEUED`\n"
+    "┗━━━━━━━━━━━━━━━━━━━━┛\n\n"
+    "🚀 Your torrent client will pick\n"
+    "it up automatically\\!\n\n"
+    "━━━━━━━━━━━━━━━━━━━━\n"
+    "💚 Happy downloading, *{user_name}*\\!"
+)
+
+BATCH_SUCCESS_TEMPLATE = (
+    "━━━━━━━━━━━━━━━━━━━━━━\n"
+    "✅ *SUCCESS\\!*\n"
+    "━━━━━━━━━━━━━━━━━━━━━━\n\n"
+    "🎉 Multiple torrents received\\!\n\n"
+    "┏━━━━━━━━━━━━━━━━━━━━┓\n"
+    "  📁 *Files Processed*\n\n"
+    "{file_list}"
+    "┗━━━━━━━━━━━━━━━━━━━━┛\n\n"
+    "🚀 Your torrent client will pick\n"
+    "them up automatically\\!\n\n"
+    "━━━━━━━━━━━━━━━━━━━━\n"
+    "💚 Happy downloading, *{user_name}*\\!"
+)
+
+RSS_DOWNLOAD_SUCCESS_TEMPLATE = (
+    "━━━━━━━━━━━━━━━━━━━━━━\n"
+    "✅ *SUCCESS\\!*\n"
+    "━━━━━━━━━━━━━━━━━━━━━━\n\n"
+    "🎉 {count} {noun} downloaded from RSS\\!\n\n"
+    "┏━━━━━━━━━━━━━━━━━━━━┓\n"
+    "  📁 *Downloaded Files*\n\n"
+    "{file_list}"
+    "┗━━━━━━━━━━━━━━━━━━━━┛\n\n"
+    "🚀 Your torrent client will pick\n"
+    "them up automatically\\!\n\n"
+    "━━━━━━━━━━━━━━━━━━━━\n"
+    "💚 Happy downloading, *{user_name}*\\!"
+)
+
+# Template filled in with the sender's chat ID via .format()
+ACCESS_DENIED_TEMPLATE = (
+    "━━━━━━━━━━━━━━━━━━━━━━\n"
+    "🚫 *ACCESS DENIED*\n"
+    "━━━━━━━━━━━━━━━━━━━━━━\n\n"
+    "⛔ You are not authorized to use\n"
+    "this bot\\.\n\n"
+    "🔑 *Your Chat ID:* `{}`\n\n"
+    "💡 Add this ID to `ALLOWED_CHAT_IDS`\n"
+    "to gain access\\.\n\n"
+    "Use /start for more info\\."
+)
+
+
+_WELCOME_TEMPLATE = (
+    "━━━━━━━━━━━━━━━━━━━━━━\n"
+    "🤖 *SEND TORRENT BOT*\n"
+    "━━━━━━━━━━━━━━━━━━━━━━\n\n"
+    "👋 Welcome *{user_name}*\\!\n\n"
+    "I help you manage torrents remotely\\.\n"
+    "Just send me a `.torrent` file and I'll\n"
+    "handle the rest\\! 🚀\n\n"
+    "┏━━━━━━━━━━━━━━━━━━━━┓\n"
+    "  {auth_emoji} *Authorization Status*\n"
+    "     {auth_text}\n"
+    "┗━━━━━━━━━━━━━━━━━━━━┛\n\n"
+    "💡 Use the menu below to get started\\!"
+)
+
+_STATUS_TEMPLATE = (
+    "━━━━━━━━━━━━━━━━━━━━━━\n"
+    "📊 *BOT STATUS*\n"
+    "━━━━━━━━━━━━━━━━━━━━━━\n\n"
+    "🟢 *System:* `ONLINE`\n\n"
+    "┏━━━━━━━━━━━━━━━━━━━━┓\n"
+    "  🔑 *Your Access*\n"
+    "     {auth_icon} `{auth_text}`\n"
+    "┗━━━━━━━━━━━━━━━━━━━━┛\n\n"
+    "📁 *Watch Folder:*\n"
+    "   `{watch_folder}`\n\n"
+    "📊 *Statistics:*\n"
+    "   • Authorized Users: `{n_users}`\n"
+    "   • Torrents in Queue: `{n_torrents}`\n\n"
+    "━━━━━━━━━━━━━━━━━━━━\n"
+    "🕐 Last checked: `Now`"
+)
+
+# Status values fixed once the config is loaded
+_N_USERS = len(ALLOWED_CHAT_IDS)
+_WATCH_FOLDER_ESC = escape_markdown_v2(WATCH_FOLDER)
+
+_CHATID_TEMPLATE = (
+    "━━━━━━━━━━━━━━━━━━━━━━\n"
+    "🔑 *YOUR CHAT ID*\n"
+    "━━━━━━━━━━━━━━━━━━━━━━\n\n"
+    "👤 *User:* {user_name}\n"
+    "🆔 *Chat ID:* `{chat_id}`\n\n"
+    "━━━━━━━━━━━━━━━━━━━━\n\n"
+    "💡 *Usage:*\n\n"
+    "Add this ID to the\n"
+    "`ALLOWED_CHAT_IDS` variable\n"
+    "in your `.env` file\\.\n\n"
+    "Example:\n"
+    "`ALLOWED_CHAT_IDS={chat_id}`\n\n"
+    "⚠️ Keep this ID private\\!"
+)
+
+
+@lru_cache(maxsize=256)
+def build_welcome_message(user_name: str, is_auth: bool) -> str:
+    """Build the /start welcome message. Expects an already escaped user name."""
+    return _WELCOME_TEMPLATE.format_map({
+        "user_name": user_name,
+        "auth_emoji": "✅" if is_auth else "⚠️",
+        "auth_text": "`AUTHORIZED`" if is_auth else "`NOT AUTHORIZED`",
+    })
+
+
+@lru_cache(maxsize=256)
+def build_status_message(is_auth: bool, torrent_count: int) -> str:
+    """Build the bot status message."""
+    return _STATUS_TEMPLATE.format_map({
+        "auth_icon": "✅" if is_auth else "❌",
+        "auth_text": "AUTHORIZED" if is_auth else "NOT AUTHORIZED",
+        "watch_folder": _WATCH_FOLDER_ESC,
+        "n_users": _N_USERS,
+        "n_torrents": torrent_count,
+    })
+
+
+@lru_cache(maxsize=256)
+def build_chatid_message(chat_id: int, user_name: str) -> str:
+    """Build the message showing a user's chat ID. Expects an already escaped user name."""
+    return _CHATID_TEMPLATE.format_map({"chat_id": chat_id, "user_name": user_name})
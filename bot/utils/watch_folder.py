@@ -0,0 +1,96 @@
+"""
+Watch Folder Utilities
+Helper functions for writing to and inspecting the torrent watch folder.
+"""
+
+import os
+import shutil
+import tempfile
+import time
+import urllib.request
+from pathlib import Path
+
+from bot.config import logger, WATCH_FOLDER, DOWNLOAD_TIMEOUT
+
+# Seconds a torrent count is reused while the watch folder's mtime is unchanged.
+# Adding, removing or renaming a file changes the mtime, so the count stays exact;
+# the TTL only guards against filesystems with coarse or unreliable mtimes.
+TORRENT_COUNT_TTL = 30.0
+
+# Last scan result: monotonic timestamp, folder mtime and torrent count
+_torrent_cache = {"t": 0.0, "mtime_ns": -1, "n": 0}
+
+# Temp files are created 0600; saved torrents get the usual umask-based mode
+# so torrent clients running as another user can still read them
+_umask = os.umask(0)
+os.umask(_umask)
+FILE_MODE = 0o666 & ~_umask
+
+
+def count_torrents() -> int:
+    """
+    Count the .torrent files currently queued in the watch folder (cached until it changes).
+    The extension is matched case-insensitively, like uploaded documents are.
+    Returns 0 if the watch folder can't be read.
+    """
+    try:
+        mtime_ns = os.stat(WATCH_FOLDER).st_mtime_ns
+        now = time.monotonic()
+        if mtime_ns == _torrent_cache["mtime_ns"] and now - _torrent_cache["t"] < TORRENT_COUNT_TTL:
+            return _torrent_cache["n"]
+
+        # DirEntry.is_file() uses the type from the directory listing, no extra stat per file
+        with os.scandir(WATCH_FOLDER) as entries:
+            count = sum(
+                1 for entry in entries
+                if entry.name[-8:].lower() == ".torrent" and entry.is_file(follow_symlinks=False)
+            )
+    except OSError as e:
+        logger.warning(f"Could not read watch folder: {e}")
+        return 0
+
+    _torrent_cache.update(t=now, mtime_ns=mtime_ns, n=count)
+    return count
+
+
+def _move_into_watch_folder(temp_path: str, file_path: Path) -> None:
+    """
+    Atomically move a finished temp file from the watch folder to its final name.
+    Blocking; call it from a worker thread.
+    """
+    os.chmod(temp_path, FILE_MODE)
+    os.replace(temp_path, file_path)
+
+
+def write_file_atomic(file_path: Path, data: bytes) -> None:
+    """
+    Write a file into the watch folder so torrent clients never see it half-written.
+    The data goes to a .part temp file in the same folder, which is then renamed into place.
+    Blocking; call it from a worker thread.
+    """
+    temp_file = tempfile.NamedTemporaryFile(dir=file_path.parent, suffix='.part', delete=False)
+    try:
+        with temp_file:
+            temp_file.write(data)
+        _move_into_watch_folder(temp_file.name, file_path)
+    except Exception:
+        Path(temp_file.name).unlink(missing_ok=True)
+        raise
+
+
+def download_file_atomic(url: str, file_path: Path) -> int:
+    """
+    Download a URL into the watch folder, the same way write_file_atomic writes data.
+    The response is streamed to the temp file instead of being held in memory.
+    Blocking; call it from a worker thread. Returns the file size in bytes.
+    """
+    temp_file = tempfile.NamedTemporaryFile(dir=file_path.parent, suffix='.part', delete=False)
+    try:
+        with temp_file, urllib.request.urlopen(url, timeout=DOWNLOAD_TIMEOUT) as response:
+            shutil.copyfileobj(response, temp_file)
+            size = temp_file.tell()
+        _move_into_watch_folder(temp_file.name, file_path)
+    except Exception:
+        Path(temp_file.name).unlink(missing_ok=True)
+        raise
+    return size